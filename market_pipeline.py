@@ -1,81 +1,254 @@
 import csv
+import gzip
+import hashlib
 import json
+import multiprocessing
 import os
+import random
 import re
+import threading
+import time
 import urllib.parse
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, date
-from typing import Optional, List, Dict, Any
-
+from html import unescape
+from html.parser import HTMLParser
+from multiprocessing.util import Finalize
+from operator import itemgetter
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Iterator, Tuple
+
+import orjson
 import requests
-from playwright.sync_api import sync_playwright
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError, sync_playwright
 
 
 # ---------- Models ----------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VehicleQuery:
     name: str
     year: int
     make: str
     model: str
     variant: Optional[str] = None
+    classic_market_url: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SaleRecord:
     sale_date: str
     price: float
     currency: str
+    # Dedupe key, computed once: (sale_date, whole cents, currency).
+    _key: Tuple[str, int, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        currency = self.currency.upper()
+        object.__setattr__(self, "currency", currency)
+        # Whole cents as an int: cheaper to hash than a rounded float.
+        object.__setattr__(self, "_key", (self.sale_date, round(self.price * 100), currency))
+
+
+BROWSER_LAUNCH_JITTER_SECONDS = 2.0
+
+# Listing text is all we need; skip the photos, fonts, styling and trackers.
+_BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+_BLOCKED_DOMAINS = ("google-analytics.com", "doubleclick.net", "googletagmanager.com")
+
+
+def _block_heavy_resources(route) -> None:
+    request = route.request
+    host = urllib.parse.urlsplit(request.url).hostname or ""
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(
+        host == d or host.endswith("." + d) for d in _BLOCKED_DOMAINS
+    ):
+        route.abort()
+    else:
+        route.continue_()
 
 
 class BaseScraper:
     name: str = "base"
+    headless: bool = True
+
+    _pw = None
+    _browser = None
+    _context = None
 
     def fetch_sales(self, vehicle: VehicleQuery) -> List[SaleRecord]:
         raise NotImplementedError
 
+    def _new_page(self):
+        # One browser and one context are launched lazily and reused for
+        # every page this scraper opens, so Chromium starts once and the
+        # context's HTTP cache carries static assets across vehicles.
+        # Playwright's sync API is bound to the launching thread, so a
+        # scraper must always be driven from the same thread.
+        if self._context is None:
+            # Stagger cold starts so parallel workers don't all spin up
+            # Chromium at the same moment.
+            time.sleep(random.uniform(0, BROWSER_LAUNCH_JITTER_SECONDS))
+            self._pw = sync_playwright().start()
+            self._browser = self._pw.chromium.launch(headless=self.headless)
+            self._context = self._browser.new_context()
+            self._context.route("**/*", _block_heavy_resources)
+        return self._context.new_page()
+
+    def close(self) -> None:
+        if self._context is not None:
+            self._context.close()
+            self._context = None
+        if self._browser is not None:
+            self._browser.close()
+            self._browser = None
+        if self._pw is not None:
+            self._pw.stop()
+            self._pw = None
+
+
+# ---------- HTTP session ----------
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _build_session()
+
 
 # ---------- FX (to USD) ----------
 
 FX_API_URL = "https://api.exchangerate.host/convert"
 
+# Rates persist across runs in a small JSON file so reruns within the TTL
+# don't hit the FX API at all.
+FX_CACHE_PATH = os.getenv("FX_CACHE_PATH", ".fx_cache.json")
+FX_CACHE_TTL_SECONDS = 24 * 60 * 60
 
-def convert_to_usd(amount: float, from_ccy: str) -> float:
-    from_ccy = from_ccy.upper()
-    if from_ccy == "USD":
-        return amount
+# Only the parent process writes the file (pool workers clear this in
+# _init_worker). Its read-modify-write isn't locked, so concurrent writers
+# could drop each other's rates.
+_FX_CACHE_WRITABLE = True
 
-    resp = requests.get(
+
+def _load_fx_cache() -> Dict[str, Any]:
+    try:
+        with open(FX_CACHE_PATH, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+
+
+def _store_fx_rate(from_ccy: str, rate: float) -> None:
+    if not _FX_CACHE_WRITABLE:
+        return
+    cache = _load_fx_cache()
+    cache[from_ccy] = {"rate": rate, "fetched_at": time.time()}
+    # Write-then-rename so readers never see a partial file.
+    tmp_path = f"{FX_CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(cache))
+        os.replace(tmp_path, FX_CACHE_PATH)
+    except OSError as e:
+        print("  Could not write FX cache:", e)
+
+
+def _fetch_usd_rate(from_ccy: str) -> float:
+    cached = _load_fx_cache().get(from_ccy)
+    if cached and time.time() - cached["fetched_at"] < FX_CACHE_TTL_SECONDS:
+        return float(cached["rate"])
+
+    resp = _SESSION.get(
         FX_API_URL,
-        params={"from": from_ccy, "to": "USD", "amount": amount},
+        params={"from": from_ccy, "to": "USD", "amount": 1},
         timeout=10,
     )
     resp.raise_for_status()
     data = resp.json()
     if "result" not in data or data["result"] is None:
         raise ValueError(f"FX API returned no result for {from_ccy} -> USD")
-    return float(data["result"])
+    rate = float(data["result"])
+    _store_fx_rate(from_ccy, rate)
+    return rate
 
 
-# ---------- Aggregation & De-duplication ----------
+# Currencies the scrapers can emit (BaT's regex and Classic.com's symbols).
+KNOWN_CURRENCIES = ("USD", "EUR", "GBP")
+
+# Per-process rate table. A failed lookup is stored as None so it isn't
+# retried (with backoff) for every vehicle. The lock makes sure each
+# currency is fetched once even if several threads ask at the same time.
+_RATE_CACHE: Dict[str, Optional[float]] = {"USD": 1.0}
+_RATE_LOCK = threading.Lock()
+
+
+def get_usd_rate(from_ccy: str) -> float:
+    from_ccy = from_ccy.upper()
+    with _RATE_LOCK:
+        if from_ccy not in _RATE_CACHE:
+            try:
+                _RATE_CACHE[from_ccy] = _fetch_usd_rate(from_ccy)
+            except Exception:
+                _RATE_CACHE[from_ccy] = None
+                raise
+        rate = _RATE_CACHE[from_ccy]
+    if rate is None:
+        raise ValueError(f"No USD rate available for {from_ccy}")
+    return rate
+
+
+def _drop_failed_rates() -> None:
+    with _RATE_LOCK:
+        for ccy in [c for c, rate in _RATE_CACHE.items() if rate is None]:
+            del _RATE_CACHE[ccy]
+
+
+def convert_to_usd(amount: float, from_ccy: str) -> float:
+    return amount * get_usd_rate(from_ccy)
+
+
+def _usd_rates_for(currencies) -> Dict[str, Optional[float]]:
+    # Rate per currency; None where no rate could be fetched.
+    rates: Dict[str, Optional[float]] = {}
+    for ccy in currencies:
+        try:
+            rates[ccy] = get_usd_rate(ccy)
+        except Exception:
+            rates[ccy] = None
+    return rates
 
-def _parse_date_iso(d: str) -> date:
-    return datetime.strptime(d, "%Y-%m-%d").date()
 
+# ---------- Aggregation & De-duplication ----------
 
 def filter_last_n_years(sales: List[SaleRecord], years: int) -> List[SaleRecord]:
     today = datetime.utcnow().date()
     cutoff = today - timedelta(days=years * 365)
+    # ISO YYYY-MM-DD strings order the same as the dates they encode, so
+    # compare strings directly instead of parsing every sale_date.
+    cutoff_iso = cutoff.isoformat()
+    today_iso = today.isoformat()
     result: List[SaleRecord] = []
     for s in sales:
-        try:
-            sd = _parse_date_iso(s.sale_date)
-        except ValueError:
-            continue
-        if sd > today:
+        sd = s.sale_date
+        if len(sd) != 10 or sd.count("-") != 2:
             continue
-        if sd >= cutoff:
+        if cutoff_iso <= sd <= today_iso:
             result.append(s)
     return result
 
@@ -84,11 +257,7 @@ def dedupe_sales(sales: List[SaleRecord]) -> List[SaleRecord]:
     seen = set()
     unique: List[SaleRecord] = []
     for s in sales:
-        key = (
-            s.sale_date,
-            round(s.price, 2),
-            s.currency.upper(),
-        )
+        key = s._key
         if key in seen:
             continue
         seen.add(key)
@@ -104,12 +273,12 @@ def build_vehicle_market_json(
     # 5-year subset
     sales_5y = filter_last_n_years(all_sales, 5)
 
+    rates = _usd_rates_for({s.currency for s in sales_5y})
+
     enriched_5y: List[Dict[str, Any]] = []
     for s in sales_5y:
-        try:
-            price_usd = convert_to_usd(s.price, s.currency)
-        except Exception:
-            price_usd = None
+        rate = rates[s.currency]
+        price_usd = s.price * rate if rate is not None else None
 
         enriched_5y.append({
             "sale_date": s.sale_date,
@@ -118,14 +287,14 @@ def build_vehicle_market_json(
             "price_usd": price_usd,
         })
 
-    # 1-year subset
-    sales_1y = filter_last_n_years(all_sales, 1)
-    prices_1y_usd = []
-    for s in sales_1y:
-        try:
-            prices_1y_usd.append(convert_to_usd(s.price, s.currency))
-        except Exception:
-            continue
+    # 1-year subset, taken from the already-converted 5-year list
+    # (ISO date strings compare lexicographically).
+    one_year_cutoff_iso = (datetime.utcnow().date() - timedelta(days=365)).isoformat()
+    prices_1y_usd = [
+        e["price_usd"]
+        for e in enriched_5y
+        if e["price_usd"] is not None and e["sale_date"] >= one_year_cutoff_iso
+    ]
 
     if prices_1y_usd:
         avg_price_1y_usd = sum(prices_1y_usd) / len(prices_1y_usd)
@@ -139,8 +308,7 @@ def build_vehicle_market_json(
     last_sale_date = None
 
     if enriched_5y:
-        sorted_sales = sorted(enriched_5y, key=lambda x: x["sale_date"], reverse=True)
-        last_sale = sorted_sales[0]
+        last_sale = max(enriched_5y, key=itemgetter("sale_date"))
         last_sale_price_usd = last_sale["price_usd"]
         last_sale_date = last_sale["sale_date"]
 
@@ -157,16 +325,88 @@ def build_vehicle_market_json(
     }
 
 
+# ---------- Static HTML fast path ----------
+
+SCRAPE_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+    ),
+}
+
+_BLOCK_TAGS = {
+    "article", "br", "div", "h1", "h2", "h3", "h4", "h5", "h6",
+    "li", "p", "section", "td", "tr",
+}
+
+
+class _ElementTextParser(HTMLParser):
+    """Collects the text content of every `tag` element, nested ones included."""
+
+    def __init__(self, tag: str):
+        super().__init__()
+        self.tag = tag
+        self.texts: List[str] = []
+        self._open: List[List[str]] = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ("script", "style"):
+            self._skip += 1
+        if tag in _BLOCK_TAGS:
+            self._append("\n")
+        if tag == self.tag:
+            self._open.append([])
+
+    def handle_endtag(self, tag):
+        if tag in ("script", "style") and self._skip:
+            self._skip -= 1
+        if tag == self.tag and self._open:
+            self.texts.append("".join(self._open.pop()).strip())
+        if tag in _BLOCK_TAGS:
+            self._append("\n")
+
+    def handle_data(self, data):
+        if not self._skip:
+            self._append(data)
+
+    def _append(self, text: str) -> None:
+        for chunks in self._open:
+            chunks.append(text)
+
+
+def _fetch_html(url: str) -> str:
+    # Plain HTTP fetch; returns "" on failure so callers can fall back to a
+    # full browser.
+    try:
+        resp = _SESSION.get(url, headers=SCRAPE_HEADERS, timeout=30)
+        resp.raise_for_status()
+    except Exception:
+        return ""
+    return resp.text
+
+
+def _element_texts(html: str, tag: str) -> List[str]:
+    parser = _ElementTextParser(tag)
+    parser.feed(html)
+    parser.close()
+    return parser.texts
+
+
 # ---------- Bring a Trailer scraper ----------
 
 BAT_RESULTS_URL = (
     "https://bringatrailer.com/auctions/results/?search={query}&sort=recent"
 )
 
-BAT_PRICE_RE = re.compile(
-    r"(Sold for|Bid to)\s+(USD|EUR|GBP)\s+[^0-9]*(\d[\d,]*)\s+on\s+(\d{1,2}/\d{1,2}/\d{2})",
-    re.IGNORECASE,
-)
+# Currency, price and date after the status phrase; shared by both regexes.
+_BAT_PRICE_TAIL = r"\s+(USD|EUR|GBP)\s+[^0-9]*(\d[\d,]*)\s+on\s+(\d{1,2}/\d{1,2}/\d{2})"
+
+BAT_PRICE_RE = re.compile(r"(?:Sold for|Bid to)" + _BAT_PRICE_TAIL, re.IGNORECASE)
+
+# Only sold lots; used when "Bid to" results are excluded so they never
+# match in the first place.
+BAT_SOLD_RE = re.compile(r"Sold for" + _BAT_PRICE_TAIL, re.IGNORECASE)
 
 
 def _parse_bat_date(us_short: str) -> str:
@@ -184,6 +424,32 @@ def _parse_bat_date(us_short: str) -> str:
     return date(year, m, d).isoformat()
 
 
+_BAT_INITIAL_DATA_RE = re.compile(r"var\s+auctionsCompletedInitialData\s*=\s*")
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _bat_initial_data_texts(html: str) -> List[str]:
+    # Each completed auction carries a "sold_text" such as
+    # "Sold for USD $58,000 <span>on 10/14/25</span>"; return those as plain
+    # text so they go through the same price regex as card text.
+    m = _BAT_INITIAL_DATA_RE.search(html)
+    if not m:
+        return []
+    try:
+        data, _ = json.JSONDecoder().raw_decode(html, m.end())
+    except ValueError:
+        return []
+    if not isinstance(data, dict):
+        return []
+
+    texts: List[str] = []
+    for item in data.get("items") or []:
+        sold_text = item.get("sold_text")
+        if sold_text:
+            texts.append(unescape(_TAG_RE.sub(" ", sold_text)))
+    return texts
+
+
 class BaTScraper(BaseScraper):
     name = "bring_a_trailer"
 
@@ -191,6 +457,7 @@ class BaTScraper(BaseScraper):
         self.max_results = max_results_per_vehicle
         self.headless = headless
         self.include_bid_to = include_bid_to
+        self._price_re = BAT_PRICE_RE if include_bid_to else BAT_SOLD_RE
 
     def _build_query(self, vehicle: VehicleQuery) -> str:
         parts = [
@@ -206,51 +473,102 @@ class BaTScraper(BaseScraper):
         query_str = self._build_query(vehicle)
         url = BAT_RESULTS_URL.format(query=urllib.parse.quote_plus(query_str))
 
-        sales: List[SaleRecord] = []
+        html = _fetch_html(url)
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=self.headless)
-            page = browser.new_page()
-            page.goto(url, wait_until="networkidle", timeout=60_000)
-            page.wait_for_timeout(2000)
+        # The results page embeds its listings as inline JSON; read that
+        # first, then the server-rendered cards.
+        sales = self._parse_cards(_bat_initial_data_texts(html))
+        if sales:
+            return sales
 
-            cards = page.query_selector_all("article")
+        sales = self._parse_cards(_element_texts(html, "article"))
+        if sales:
+            return sales
 
-            for card in cards:
-                if len(sales) >= self.max_results:
-                    break
+        # Fast path found nothing (likely JS-rendered); use a real browser.
+        page = self._new_page()
+        try:
+            page.goto(url, wait_until="domcontentloaded", timeout=60_000)
+            try:
+                page.wait_for_selector("article", timeout=15_000)
+            except PlaywrightTimeoutError:
+                pass
 
-                text = card.inner_text()
-                m = BAT_PRICE_RE.search(text)
-                if not m:
-                    continue
+            texts = page.locator("article").all_inner_texts()
+        finally:
+            page.close()
 
-                status, ccy, price_raw, date_raw = m.groups()
+        return self._parse_cards(texts)
 
-                if not self.include_bid_to and status.lower().startswith("bid to"):
-                    continue
+    def _parse_cards(self, texts: List[str]) -> List[SaleRecord]:
+        sales: List[SaleRecord] = []
+        # Drop repeats as we go (the same lot can appear in several cards).
+        seen = set()
 
-                try:
-                    price = float(price_raw.replace(",", ""))
-                    sale_date_iso = _parse_bat_date(date_raw)
-                except Exception:
-                    continue
+        for text in texts:
+            if len(sales) >= self.max_results:
+                break
 
-                sales.append(
-                    SaleRecord(
-                        sale_date=sale_date_iso,
-                        price=price,
-                        currency=ccy.upper(),
-                    )
-                )
+            m = self._price_re.search(text)
+            if not m:
+                continue
 
-            browser.close()
+            ccy, price_raw, date_raw = m.groups()
+
+            try:
+                price = float(price_raw.replace(",", ""))
+                sale_date_iso = _parse_bat_date(date_raw)
+            except Exception:
+                continue
+
+            sale = SaleRecord(
+                sale_date=sale_date_iso,
+                price=price,
+                currency=ccy,
+            )
+            key = sale._key
+            if key in seen:
+                continue
+            seen.add(key)
+            sales.append(sale)
 
         return sales
 
 
 # ---------- Classic.com scraper ----------
 
+CLASSIC_PRICE_RE = re.compile(
+    r"""
+    ([€$£])                 # currency symbol
+    (
+        \d{1,3}(?:,\d{3})+     # "$490,000"
+      | \d{1,3}(?:\.\d{3})+    # "€1.250.000" (dot grouping)
+      | \d+                    # "$950"
+    )
+    """,
+    re.VERBOSE,
+)
+
+CLASSIC_DATE_RE = re.compile(
+    r"""
+    (Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)
+    \s+(\d{1,2}),\s+(\d{4})   # "Oct 18, 2025"
+    """,
+    re.VERBOSE,
+)
+
+_MONTHS = {
+    name: i
+    for i, name in enumerate(
+        ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+         "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"),
+        start=1,
+    )
+}
+
+_SYMBOL_TO_CCY = {"$": "USD", "€": "EUR", "£": "GBP"}
+
+
 class ClassicComScraper(BaseScraper):
     name = "classic_com"
 
@@ -258,55 +576,67 @@ class ClassicComScraper(BaseScraper):
         self.headless = headless
 
     def fetch_sales_for_market(self, market_url: str) -> List[SaleRecord]:
+        texts = [
+            t for t in _element_texts(_fetch_html(market_url), "div")
+            if "sold" in t.lower()
+        ]
+        sales = self._parse_cards(texts)
+        if sales:
+            return sales
+
+        # Fast path found nothing (likely JS-rendered); use a real browser.
+        page = self._new_page()
+        try:
+            page.goto(market_url, wait_until="domcontentloaded", timeout=60_000)
+            try:
+                page.wait_for_selector("div:has-text('Sold')", timeout=15_000)
+            except PlaywrightTimeoutError:
+                pass
+
+            texts = page.locator("div:has-text('Sold')").all_inner_texts()
+        finally:
+            page.close()
+
+        return self._parse_cards(texts)
+
+    def _parse_cards(self, texts: List[str]) -> List[SaleRecord]:
         sales: List[SaleRecord] = []
+        # Drop repeats as we go (the same lot can appear in several cards).
+        seen = set()
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=self.headless)
-            page = browser.new_page()
-            page.goto(market_url, wait_until="networkidle", timeout=60_000)
-            page.wait_for_timeout(2000)
-
-            cards = page.query_selector_all("div:has-text('Sold')")
-
-            for card in cards:
-                text = card.inner_text()
-
-                # Price like "$490,000"
-                m_price = re.search(r"([€$£])([\d,]+)", text)
-                m_date = re.search(
-                    r"(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},\s+\d{4}",
-                    text,
-                )
-                if not (m_price and m_date):
-                    continue
-
-                symbol = m_price.group(1)
-                price_raw = m_price.group(2)
-                dt_str = m_date.group(0)
-
-                symbol_to_ccy = {"$": "USD", "€": "EUR", "£": "GBP"}
-                ccy = symbol_to_ccy.get(symbol, "USD")
-
-                try:
-                    price = float(price_raw.replace(",", ""))
-                except:
-                    continue
-
-                try:
-                    dt = datetime.strptime(dt_str, "%b %d, %Y").date()
-                    sale_date_iso = dt.isoformat()
-                except:
-                    continue
-
-                sales.append(
-                    SaleRecord(
-                        sale_date=sale_date_iso,
-                        price=price,
-                        currency=ccy,
-                    )
-                )
-
-            browser.close()
+        for text in texts:
+            m_price = CLASSIC_PRICE_RE.search(text)
+            m_date = CLASSIC_DATE_RE.search(text)
+            if not (m_price and m_date):
+                continue
+
+            symbol = m_price.group(1)
+            price_raw = m_price.group(2)
+            month, day, year = m_date.groups()
+
+            ccy = _SYMBOL_TO_CCY[symbol]
+
+            try:
+                price = float(price_raw.replace(",", "").replace(".", ""))
+            except:
+                continue
+
+            # Build the date from the regex groups; no strptime per card.
+            try:
+                sale_date_iso = date(int(year), _MONTHS[month], int(day)).isoformat()
+            except ValueError:
+                continue
+
+            sale = SaleRecord(
+                sale_date=sale_date_iso,
+                price=price,
+                currency=ccy,
+            )
+            key = sale._key
+            if key in seen:
+                continue
+            seen.add(key)
+            sales.append(sale)
 
         return sales
 
@@ -322,6 +652,55 @@ class CollectingCarsScraper(BaseScraper):
 
 # ---------- API + IO ----------
 
+# Scrape results are cached on disk per (source, vehicle); auction results
+# change slowly, so reruns within the TTL skip the scrapers entirely.
+SCRAPE_CACHE_DIR = os.getenv("SCRAPE_CACHE_DIR", "cache")
+SCRAPE_CACHE_TTL_SECONDS = float(os.getenv("SCRAPE_CACHE_TTL_HOURS", "6")) * 60 * 60
+
+
+def _safe_name(vehicle: VehicleQuery) -> str:
+    return vehicle.name.replace(" ", "_").replace("/", "-")
+
+
+def _cache_path(vehicle: VehicleQuery, source: str, cache_tag: str) -> Path:
+    name = f"{source}_{vehicle.year}_{_safe_name(vehicle)}"
+    if cache_tag:
+        # cache_tag is whatever the scrape depends on (BaT search query,
+        # Classic.com market URL), so editing the CSV isn't masked by
+        # sales cached from the old search.
+        tag_hash = hashlib.sha1(cache_tag.encode("utf-8")).hexdigest()[:12]
+        name = f"{name}_{tag_hash}"
+    return Path(SCRAPE_CACHE_DIR) / f"{name}.json"
+
+
+def _cached_scrape(
+    source: str, vehicle: VehicleQuery, cache_tag: str, fetch, *args
+) -> List[SaleRecord]:
+    path = _cache_path(vehicle, source, cache_tag)
+    try:
+        if time.time() - path.stat().st_mtime < SCRAPE_CACHE_TTL_SECONDS:
+            return [SaleRecord(**d) for d in orjson.loads(path.read_bytes())]
+    except (OSError, orjson.JSONDecodeError, TypeError):
+        pass
+
+    sales = fetch(*args)
+    # An empty result may just be a blocked or failed fetch (those return
+    # [] rather than raising), so only cache real results.
+    if not sales:
+        return sales
+
+    # Write-then-rename so concurrent workers never see a partial file.
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # orjson skips underscore fields, so the cached _key isn't stored.
+        tmp_path.write_bytes(orjson.dumps(sales))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"    Could not cache {source} results:", e)
+    return sales
+
+
 def post_to_market_api(payload: Dict[str, Any]) -> None:
     api_url = os.getenv("MARKET_API_URL")
     if not api_url:
@@ -333,88 +712,139 @@ def post_to_market_api(payload: Dict[str, Any]) -> None:
     if token:
         headers["Authorization"] = f"Bearer {token}"
 
-    resp = requests.post(api_url, headers=headers, json=payload, timeout=15)
+    # Compact (no indent): the snapshot is only read by the API.
+    body = orjson.dumps(payload)
+    # Opt-in, since not every server decodes gzip request bodies.
+    if os.getenv("MARKET_API_GZIP") == "1":
+        body = gzip.compress(body, compresslevel=6)
+        headers["Content-Encoding"] = "gzip"
+    resp = _SESSION.post(api_url, headers=headers, data=body, timeout=15)
     resp.raise_for_status()
     print("  Posted to API:", resp.status_code)
 
 
-def load_vehicles_from_csv(path: str) -> List[Dict[str, Any]]:
-    rows: List[Dict[str, Any]] = []
+def iter_vehicles(path: str) -> Iterator[VehicleQuery]:
     with open(path, newline="", encoding="utf-8") as f:
         reader = csv.DictReader(f)
         for row in reader:
-            rows.append(row)
-    return rows
+            yield VehicleQuery(
+                name=row["name"],
+                year=int(row["year"]),
+                make=row["make"],
+                model=row["model"],
+                variant=row.get("variant") or None,
+                classic_market_url=row.get("classic_market_url") or None,
+            )
 
 
 # ---------- Main pipeline ----------
 
-def main():
-    bat_scraper = BaTScraper(include_bid_to=False)
-    classic_scraper = ClassicComScraper()
-    cc_scraper = CollectingCarsScraper()
-
-    rows = load_vehicles_from_csv("vehicles.csv")
-    print(f"Loaded {len(rows)} vehicles.")
-
-    all_vehicle_payloads = []
-
-    for row in rows:
-        vehicle = VehicleQuery(
-            name=row["name"],
-            year=int(row["year"]),
-            make=row["make"],
-            model=row["model"],
-            variant=row.get("variant") or None,
-        )
-
-        print(f"\nProcessing {vehicle.name} ({vehicle.year})")
+# Per-worker-process state, set up by _init_worker. Scrapers (and their
+# Playwright browsers) are created inside each worker rather than inherited
+# from the parent, and each scraper gets a dedicated thread so its browser
+# is always driven from the thread that launched it.
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker() -> None:
+    global _FX_CACHE_WRITABLE
+    _FX_CACHE_WRITABLE = False
+    # No-op when the table was inherited from the parent.
+    _usd_rates_for(KNOWN_CURRENCIES)
+    _WORKER["bat"] = BaTScraper(include_bid_to=False)
+    _WORKER["classic"] = ClassicComScraper()
+    _WORKER["cc"] = CollectingCarsScraper()
+    _WORKER["threads"] = {
+        key: ThreadPoolExecutor(max_workers=1) for key in ("bat", "classic", "cc")
+    }
+    Finalize(None, _close_worker, exitpriority=10)
 
-        all_sales: List[SaleRecord] = []
 
-        # Bring a Trailer
+def _close_worker() -> None:
+    for key, ex in _WORKER.pop("threads", {}).items():
         try:
-            print("  Scraping BaT...")
-            bat_sales = bat_scraper.fetch_sales(vehicle)
-            print(f"    {len(bat_sales)} BaT sales")
-            all_sales.extend(bat_sales)
+            ex.submit(_WORKER[key].close).result()
         except Exception as e:
-            print("    Error:", e)
-
-        # Collecting Cars
+            print(f"  Error closing {key} scraper:", e)
+        ex.shutdown()
+
+
+def process_vehicle(vehicle: VehicleQuery) -> Optional[Dict[str, Any]]:
+    bat_scraper = _WORKER["bat"]
+    classic_scraper = _WORKER["classic"]
+    cc_scraper = _WORKER["cc"]
+    threads = _WORKER["threads"]
+
+    print(f"\nProcessing {vehicle.name} ({vehicle.year})")
+
+    all_sales: List[SaleRecord] = []
+
+    # The sources are independent and I/O bound, so scrape them concurrently.
+    classic_url = vehicle.classic_market_url
+    print("  Scraping BaT...")
+    futs = {
+        threads["bat"].submit(
+            _cached_scrape, bat_scraper.name, vehicle, bat_scraper._build_query(vehicle),
+            bat_scraper.fetch_sales, vehicle,
+        ): "BaT",
+        threads["cc"].submit(
+            _cached_scrape, cc_scraper.name, vehicle, "", cc_scraper.fetch_sales, vehicle
+        ): "Collecting Cars",
+    }
+    if classic_url:
+        print(f"  Scraping Classic.com: {classic_url}")
+        futs[threads["classic"].submit(
+            _cached_scrape, classic_scraper.name, vehicle, classic_url,
+            classic_scraper.fetch_sales_for_market, classic_url,
+        )] = "Classic.com"
+
+    for fut in as_completed(futs):
+        source = futs[fut]
         try:
-            cc_sales = cc_scraper.fetch_sales(vehicle)
-            all_sales.extend(cc_sales)
+            sales = fut.result()
         except Exception as e:
-            print("    Error:", e)
-
-        # Classic.com
-        classic_url = row.get("classic_market_url") or ""
-        if classic_url:
-            try:
-                print(f"  Scraping Classic.com: {classic_url}")
-                classic_sales = classic_scraper.fetch_sales_for_market(classic_url)
-                print(f"    {len(classic_sales)} Classic.com sales")
-                all_sales.extend(classic_sales)
-            except Exception as e:
-                print("    Error:", e)
-
-        if not all_sales:
-            print("  No sales found for this vehicle.")
+            print(f"    {source} error:", e)
             continue
+        print(f"    {len(sales)} {source} sales")
+        all_sales.extend(sales)
+
+    if not all_sales:
+        print("  No sales found for this vehicle.")
+        return None
+
+    all_sales = dedupe_sales(all_sales)
+    print(f"  After de-duplication: {len(all_sales)} sales")
 
-        all_sales = dedupe_sales(all_sales)
-        print(f"  After de-duplication: {len(all_sales)} sales")
+    payload = build_vehicle_market_json(vehicle, all_sales)
 
-        payload = build_vehicle_market_json(vehicle, all_sales)
+    # Save per-vehicle JSON (indented; these files are meant for humans)
+    out_name = f"out_{vehicle.year}_{_safe_name(vehicle)}.json"
+    Path(out_name).write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
 
-        # Save per-vehicle JSON
-        safe_name = vehicle.name.replace(" ", "_").replace("/", "-")
-        out_name = f"out_{vehicle.year}_{safe_name}.json"
-        with open(out_name, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2)
+    return payload
 
-        all_vehicle_payloads.append(payload)
+
+def main():
+    # Warm the FX table once in the parent: forked workers inherit it, and
+    # under spawn they read the on-disk cache this writes.
+    _usd_rates_for(KNOWN_CURRENCIES)
+    # Don't hand a failed lookup down to every worker; each retries it once.
+    _drop_failed_rates()
+    # Drop the warm-up's keep-alive connections: forked workers would
+    # otherwise share (and interleave requests on) the same sockets.
+    _SESSION.close()
+
+    vehicles = iter_vehicles("vehicles.csv")
+
+    processes = min(os.cpu_count() or 1, 8)
+    with multiprocessing.Pool(processes=processes, initializer=_init_worker) as pool:
+        all_vehicle_payloads = [
+            p for p in pool.imap(process_vehicle, vehicles) if p
+        ]
+        # close + join (rather than the implicit terminate) lets each
+        # worker run _close_worker and shut its browsers down cleanly.
+        pool.close()
+        pool.join()
 
     if not all_vehicle_payloads:
         print("No vehicles produced results.")